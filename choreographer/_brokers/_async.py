@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import warnings
 from functools import partial
 from typing import TYPE_CHECKING
@@ -64,10 +65,14 @@ class Broker:
         self._background_tasks_cancellable: set[asyncio.Task[Any]] = set()
         # if its a user task, can cancel
         self._current_read_task: asyncio.Task[Any] | None = None
+        self._current_write_task: asyncio.Task[Any] | None = None
         self.futures = {}
         self._subscriptions_futures = {}
 
-        self._write_lock = asyncio.Lock()
+        # commands wait here until the write loop drains them in one batch
+        self._outbox: asyncio.Queue[
+            tuple[protocol.MessageKey, protocol.BrowserCommand]
+        ] = asyncio.Queue()
 
     def new_subscription_future(
         self,
@@ -85,7 +90,7 @@ class Broker:
         self._subscriptions_futures[session_id][subscription].append(future)
         return future
 
-    def clean(self) -> None:
+    def clean(self) -> None:  # noqa: C901 complexity
         _logger.debug("Cancelling message futures")
         for future in self.futures.values():
             if not future.done():
@@ -95,6 +100,10 @@ class Broker:
         if self._current_read_task and not self._current_read_task.done():
             _logger.debug2(f"Cancelling read: {self._current_read_task}")
             self._current_read_task.cancel()
+        _logger.debug("Cancelling write task")
+        if self._current_write_task and not self._current_write_task.done():
+            _logger.debug2(f"Cancelling write: {self._current_write_task}")
+            self._current_write_task.cancel()
         _logger.debug("Cancelling subscription-futures")
         for session in self._subscriptions_futures.values():
             for query in session.values():
@@ -126,7 +135,7 @@ class Broker:
                     _logger.error("Error in run_read_loop.", exc_info=e)
                     raise e
 
-        async def read_loop() -> None:  # noqa: PLR0912, PLR0915, C901
+        async def read_loop() -> None:  # noqa: PLR0912, C901
             loop = asyncio.get_running_loop()
             fn = partial(self._channel.read_jsons, blocking=True)
             responses = await loop.run_in_executor(
@@ -170,7 +179,7 @@ class Broker:
                         "Checking for event subscription future.",
                     )
                     if session_futures:
-                        for query in session_futures:
+                        for query in list(session_futures):
                             match = (
                                 query.endswith("*")
                                 and response["method"].startswith(query[:-1])
@@ -179,29 +188,12 @@ class Broker:
                                 _logger.debug2(
                                     "Found event subscription future.",
                                 )
-                                for future in session_futures[query]:
+                                # drop the query so the next event skips it
+                                for future in session_futures.pop(query):
                                     if not future.done():
                                         future.set_result(response)
-                                session_futures[query] = []
 
-                    _logger.debug2(
-                        "Checking for event subscription callback.",
-                    )
-                    for query in list(event_session.subscriptions):
-                        match = (
-                            query.endswith("*")
-                            and response["method"].startswith(query[:-1])
-                        ) or (response["method"] == query)
-                        _logger.debug2(
-                            "Found event subscription callback.",
-                        )
-                        if match:
-                            t: asyncio.Task[Any] = asyncio.create_task(
-                                event_session.subscriptions[query][0](response),
-                            )
-                            self._background_tasks_cancellable.add(t)
-                            if not event_session.subscriptions[query][1]:
-                                event_session.unsubscribe(query)
+                    self._run_subscription_callbacks(event_session, response)
 
                 elif key:
                     _logger.debug(f"Have a response with key {key}")
@@ -228,6 +220,76 @@ class Broker:
         read_task.add_done_callback(check_read_loop_error)
         self._current_read_task = read_task
 
+    def _run_subscription_callbacks(
+        self,
+        session: Session,
+        response: protocol.BrowserResponse,
+    ) -> None:
+        _logger.debug2(
+            "Checking for event subscription callback.",
+        )
+        for callback in session._get_callbacks(response["method"]):  # noqa: SLF001
+            _logger.debug2(
+                "Found event subscription callback.",
+            )
+            # plain functions run here, no need for a task
+            try:
+                result = callback(response)
+            except Exception:
+                _logger.exception("Error in subscription callback.")
+                continue
+            if inspect.iscoroutine(result):
+                t: asyncio.Task[Any] = asyncio.create_task(result)
+                self._background_tasks_cancellable.add(t)
+
+    async def _write_batch(
+        self,
+        batch: list[tuple[protocol.MessageKey, protocol.BrowserCommand]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                None,
+                self._channel.write_jsons,
+                [obj for _, obj in batch],
+            )
+        except Exception as e:  # noqa: BLE001 pass it to whoever is waiting
+            if len(batch) > 1:
+                # nothing was written, so one bad command can't fail the rest:
+                # write each alone and only fail the ones that fail again
+                _logger.debug("Batch write failed, writing commands one by one.")
+                for item in batch:
+                    await self._write_batch([item])
+                return
+            for key, _ in batch:
+                future = self.futures.pop(key, None)
+                if future and not future.done():
+                    future.set_exception(e)
+                _logger.debug(f"Future for {key} deleted.")
+
+    def run_write_loop(self) -> None:
+        def check_write_loop_error(result: asyncio.Future[Any]) -> None:
+            if result.cancelled():
+                _logger.debug("Write loop cancelled.")
+                return
+            e = result.exception()
+            if e:
+                # write_json will fall back to writing directly
+                _logger.error("Error in run_write_loop.", exc_info=e)
+
+        async def write_loop() -> None:
+            while True:
+                # block for the first command, then take whatever else is waiting
+                batch = [await self._outbox.get()]
+                while not self._outbox.empty():
+                    batch.append(self._outbox.get_nowait())
+                _logger.debug(f"Write loop found {len(batch)} commands.")
+                await self._write_batch(batch)
+
+        write_task = asyncio.create_task(write_loop())
+        write_task.add_done_callback(check_write_loop_error)
+        self._current_write_task = write_task
+
     async def write_json(
         self,
         obj: protocol.BrowserCommand,
@@ -244,18 +306,11 @@ class Broker:
         future: asyncio.Future[protocol.BrowserResponse] = loop.create_future()
         self.futures[key] = future
         _logger.debug(f"Created future: {key} {future}")
-        try:
-            async with self._write_lock:
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None,
-                    self._channel.write_json,
-                    obj,
-                )
-        except BaseException as e:  # noqa: BLE001
-            future.set_exception(e)
-            del self.futures[key]
-            _logger.debug(f"Future for {key} deleted.")
+        if self._current_write_task and not self._current_write_task.done():
+            self._outbox.put_nowait((key, obj))
+        else:
+            # no write loop (not open or already cleaned), write directly
+            await self._write_batch([(key, obj)])
         return await future
 
     def _get_target_session_by_session_id(
@@ -41,21 +41,42 @@ class BrokerSync:
         self._browser = browser
         self._channel = channel
 
-    def run_output_thread(self, **kwargs: Any) -> None:
+    def run_output_thread(self, *, raw: bool = False, **kwargs: Any) -> None:
         """
         Run a thread which dumps all browser messages. kwargs is passed to print.
 
+        Args:
+            raw: print messages as received, without parsing and indenting them.
+            kwargs: passed directly to print().
+
         Raises:
             ChannelClosedError: When the channel is closed, this error is raised.
 
         """
+        # one print per read, joined so the output matches one print per message
+        end = kwargs.get("end")
+        if end is None:  # print() treats end=None as the default
+            end = "\n"
 
         def run_print() -> None:
             try:
                 while True:
+                    if raw:
+                        frames = self._channel.read_frames()
+                        if not frames:
+                            continue
+                        print(  # noqa: T201 print is the point
+                            end.join(str(frame, "utf-8") for frame in frames),
+                            **kwargs,
+                        )
+                        continue
                     responses = self._channel.read_jsons()
-                    for response in responses:
-                        print(json.dumps(response, indent=4), **kwargs)  # noqa: T201 print in the point
+                    if not responses:
+                        continue
+                    print(  # noqa: T201 print in the point
+                        end.join(json.dumps(r, indent=4) for r in responses),
+                        **kwargs,
+                    )
             except ChannelClosedError:
                 print("ChannelClosedError caught.", **kwargs)  # noqa: T201 print is the point
 
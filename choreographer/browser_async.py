@@ -33,6 +33,57 @@ if TYPE_CHECKING:
 _logger = logistro.getLogger(__name__)
 
 
+async def _wait_for_exit(
+    process: subprocess.Popen[bytes],
+    timeout: float | None = None,
+) -> bool:
+    """
+    Wait for process to exit, polling a pidfd instead of blocking a thread.
+
+    Args:
+        process: the process to wait on.
+        timeout: seconds to wait, None (default) waits forever.
+
+    Returns:
+        True if the process exited, False if the timeout expired first.
+
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _wait_in_executor() -> bool:
+        try:
+            await loop.run_in_executor(None, process.wait, timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    try:
+        pidfd = os.pidfd_open(process.pid)  # type: ignore [attr-defined, unused-ignore]
+    except (AttributeError, OSError):  # not linux, old kernel, or already reaped
+        _logger.debug2("No pidfd available, waiting in executor.")
+        return await _wait_in_executor()
+    exited = loop.create_future()
+
+    def _on_exit() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    try:
+        loop.add_reader(pidfd, _on_exit)
+    except NotImplementedError:  # loop can't select on fds
+        os.close(pidfd)
+        return await _wait_in_executor()
+    try:
+        await asyncio.wait_for(exited, timeout)
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+    process.wait()  # the process has exited, this only reaps it
+    return True
+
+
 class Tab(Target):
     """A wrapper for `Target`, so user can use `Tab`, not `Target`."""
 
@@ -45,7 +96,7 @@ class Browser(Target):
     """`Browser` is the async implementation of `Browser`."""
 
     tabs: MutableMapping[str, Tab]
-    """A mapping by target_id of all the targets which are open tabs."""
+    """A mapping by target_id of all the open tabs, in the order they were added."""
     targets: MutableMapping[str, Target]
     """A mapping by target_id of ALL the targets."""
     # Don't init instance attributes with mutables
@@ -100,6 +151,7 @@ class Browser(Target):
         # Compose Resources
         self._channel = channel_cls()
         self._broker = Broker(self, self._channel)
+        super().__init__("0", self._broker)
         self._browser_impl = browser_cls(self._channel, path, **kwargs)
         if hasattr(browser_cls, "logger_parser"):
             parser = browser_cls.logger_parser
@@ -124,7 +176,10 @@ class Browser(Target):
         env = self._browser_impl.get_env()
         args = self._browser_impl.get_popen_args()
 
-        # asyncio's equiv doesn't work in all situations
+        # asyncio's equiv doesn't work in all situations:
+        # a SelectorEventLoop on windows can't spawn subprocesses at all.
+        # Popen + executor works on any loop, and since the channel is read
+        # and written in executor threads too, no loop policy is needed.
         def run() -> subprocess.Popen[bytes]:
             return subprocess.Popen(  # noqa: S603
                 cli,
@@ -137,12 +192,13 @@ class Browser(Target):
         loop = asyncio.get_running_loop()
         self.subprocess = await loop.run_in_executor(None, run)
 
-        super().__init__("0", self._broker)
         self._add_session(Session("", self._broker))
 
         try:
             _logger.debug("Starting watchdog")
             self._watch_dog_task = asyncio.create_task(self._watchdog())
+            _logger.debug("Running write loop")
+            self._broker.run_write_loop()
             _logger.debug("Running read loop")
             self._broker.run_read_loop()
             _logger.debug("Populating Targets")
@@ -166,17 +222,14 @@ class Browser(Target):
         return self.__aenter__().__await__()
 
     async def _is_closed(self, wait: int | None = 0) -> bool:
+        if self.subprocess.returncode is not None:  # already reaped, no syscall
+            return True
         if wait == 0:
             # poll returns None if its open
             _is_open = self.subprocess.poll() is None
             return not _is_open
         else:
-            try:
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.subprocess.wait, wait)
-            except subprocess.TimeoutExpired:
-                return False
-        return True
+            return await _wait_for_exit(self.subprocess, wait)
 
     async def _close(self) -> None:
         if await self._is_closed():
@@ -247,7 +300,7 @@ class Browser(Target):
             _logger.debug("In watchdog")
             loop = asyncio.get_running_loop()
             _logger.debug2("Running wait.")
-            await loop.run_in_executor(None, self.subprocess.wait)
+            await _wait_for_exit(self.subprocess)
             _logger.warning("Wait expired, Browser is being closed by watchdog.")
             self._watch_dog_task = None
             await self.close()
@@ -260,9 +313,7 @@ class Browser(Target):
         self.tabs[tab.target_id] = tab
 
     def _remove_tab(self, target_id: str) -> None:
-        if isinstance(target_id, Tab):
-            target_id = target_id.target_id
-        del self.tabs[target_id]
+        del self.tabs[getattr(target_id, "target_id", target_id)]
 
     def get_tab(self) -> Tab | None:
         """
@@ -272,9 +323,7 @@ class Browser(Target):
             A tab object.
 
         """
-        if self.tabs.values():
-            return next(iter(self.tabs.values()))
-        return None
+        return next(iter(self.tabs.values()), None)
 
     async def populate_targets(self) -> None:
         """Solicit the actual browser for all targets to add to the browser object."""
@@ -286,25 +335,36 @@ class Browser(Target):
                 response["error"],
             )
 
-        for json_response in response["result"]["targetInfos"]:
+        new_tabs = [
+            Tab(json_response["targetId"], self._broker)
+            for json_response in response["result"]["targetInfos"]
+            if json_response["type"] == "page"
+            and json_response["targetId"] not in self.tabs
+        ]
+        # each session is a round trip to the browser, so ask for all at once
+        results = await asyncio.gather(
+            *(new_tab.create_session() for new_tab in new_tabs),
+            return_exceptions=True,
+        )
+        # add every tab that got a session before raising, so none are leaked
+        error: BaseException | None = None
+        for new_tab, result in zip(new_tabs, results):
+            target_id = new_tab.target_id
             if (
-                json_response["type"] == "page"
-                and json_response["targetId"] not in self.tabs
+                isinstance(result, protocol.DevtoolsProtocolError)
+                and result.code == protocol.Ecode.TARGET_NOT_FOUND
             ):
-                target_id = json_response["targetId"]
-                new_tab = Tab(target_id, self._broker)
-                try:
-                    await new_tab.create_session()
-                except protocol.DevtoolsProtocolError as e:
-                    if e.code == protocol.Ecode.TARGET_NOT_FOUND:
-                        _logger.warning(
-                            f"Target {target_id} not found (could be closed before)",
-                        )
-                        continue
-                    else:
-                        raise
-                self._add_tab(new_tab)
-                _logger.debug(f"The target {target_id} was added")
+                _logger.warning(
+                    f"Target {target_id} not found (could be closed before)",
+                )
+                continue
+            elif isinstance(result, BaseException):
+                error = error or result
+                continue
+            self._add_tab(new_tab)
+            _logger.debug(f"The target {target_id} was added")
+        if error:
+            raise error
 
     async def create_session(self) -> Session:
         """
@@ -387,8 +447,7 @@ class Browser(Target):
         """
         if await self._is_closed():
             raise BrowserClosedError("close_tab() called on a closed browser")
-        if isinstance(target_id, Target):
-            target_id = target_id.target_id
+        target_id = getattr(target_id, "target_id", target_id)
         # NOTE: we don't need to manually remove sessions because
         # sessions are intrinsically handled by events
         response = await self.send_command(
@@ -39,7 +39,7 @@ class BrowserSync(TargetSync):
     # with this class
 
     tabs: MutableMapping[str, TabSync]
-    """A mapping by target_id of all the targets which are open tabs."""
+    """A mapping by target_id of all the open tabs, in the order they were added."""
     targets: MutableMapping[str, TargetSync]
     """A mapping by target_id of ALL the targets."""
     # Don't init instance attributes with mutables
@@ -87,6 +87,7 @@ class BrowserSync(TargetSync):
         # Compose Resources
         self._channel = channel_cls()
         self._broker = BrokerSync(self, self._channel)
+        super().__init__("0", self._broker)
         self._browser_impl = browser_cls(self._channel, path, **kwargs)
         if hasattr(browser_cls, "logger_parser"):
             parser = browser_cls.logger_parser
@@ -107,7 +108,6 @@ class BrowserSync(TargetSync):
             env=self._browser_impl.get_env(),
             **self._browser_impl.get_popen_args(),
         )
-        super().__init__("0", self._broker)
         self._add_session(SessionSync("", self._broker))
 
     def __enter__(self) -> Self:
@@ -116,8 +116,11 @@ class BrowserSync(TargetSync):
         return self
 
     def _is_closed(self, wait: int | None = 0) -> bool:
+        if self.subprocess.returncode is not None:  # already reaped, no syscall
+            return True
         if wait == 0:
-            return self.subprocess.poll() is None
+            # poll returns None if its open
+            return self.subprocess.poll() is not None
         else:
             try:
                 self.subprocess.wait(wait)
@@ -184,23 +187,20 @@ class BrowserSync(TargetSync):
         self.tabs[tab.target_id] = tab
 
     def _remove_tab(self, target_id: str) -> None:
-        if isinstance(target_id, TabSync):
-            target_id = target_id.target_id
-        del self.tabs[target_id]
+        del self.tabs[getattr(target_id, "target_id", target_id)]
 
     def get_tab(self) -> TabSync | None:
         """Get the first tab if there is one. Useful for default tabs."""
-        if self.tabs.values():
-            return next(iter(self.tabs.values()))
-        return None
+        return next(iter(self.tabs.values()), None)
 
     # wrap our broker for convenience
-    def start_output_thread(self, **kwargs: Any) -> None:
+    def start_output_thread(self, *, raw: bool = False, **kwargs: Any) -> None:
         """
         Start a separate thread that dumps all messages received to stdout.
 
         Args:
+            raw: print messages as received, skipping the json parse.
             kwargs: passed directly to print().
 
         """
-        self._broker.run_output_thread(**kwargs)
+        self._broker.run_output_thread(raw=raw, **kwargs)
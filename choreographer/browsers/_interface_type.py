@@ -23,6 +23,6 @@ class BrowserImplInterface(Protocol):
     ) -> None: ...
     def get_popen_args(self) -> Mapping[str, Any]: ...
     def get_cli(self) -> Sequence[str]: ...
-    def get_env(self) -> MutableMapping[str, str]: ...
+    def get_env(self) -> MutableMapping[str, str] | None: ...
     def clean(self) -> None: ...
     def is_isolated(self) -> bool: ...
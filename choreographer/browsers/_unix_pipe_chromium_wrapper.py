@@ -28,13 +28,12 @@ import sys
 from functools import partial
 from typing import TYPE_CHECKING
 
-import logistro
+# stdlib only: this runs in a fresh interpreter on every browser launch,
+# so every import here is paid before chromium can even start
 
 if TYPE_CHECKING:
     from types import FrameType
 
-_logger = logistro.getLogger("chrome_wrapper")
-
 # we're a wrapper, the cli is everything that came after us
 cli = sys.argv[1:]
 
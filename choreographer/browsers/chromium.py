@@ -65,7 +65,11 @@ class Chromium:
     skip_local: bool
     """True if we want to avoid looking for our local download when searching path."""
     tmp_dir: TmpDirectory
-    """A reference to a temporary directory object the chromium needs to store data."""
+    """
+    A reference to a temporary directory object the chromium needs to store data.
+
+    It is created the first time the cli is built, not on construction.
+    """
 
     @classmethod
     def logger_parser(
@@ -150,6 +154,9 @@ class Chromium:
 
         self._is_isolated = "snap" in str(self.path)
 
+    def _make_tmp_dir(self) -> None:
+        if hasattr(self, "tmp_dir"):
+            return
         self.tmp_dir = TmpDirectory(
             path=self._tmp_dir_path,
             sneak=self._is_isolated,
@@ -183,6 +190,7 @@ class Chromium:
 
     def get_cli(self) -> Sequence[str]:
         """Return the CLI command for chromium."""
+        self._make_tmp_dir()
         if platform.system() != "Windows":
             cli = [
                 str(sys.executable),
@@ -245,10 +253,11 @@ class Chromium:
         _logger.debug(f"Returning cli: {cli}")
         return cli
 
-    def get_env(self) -> MutableMapping[str, str]:
-        """Return the env needed for chromium."""
+    def get_env(self) -> MutableMapping[str, str] | None:
+        """Return the env needed for chromium, `None` to inherit ours."""
+        # None lets Popen pass our environment through without copying it
         _logger.debug("Returning env: same env, no modification.")
-        return os.environ.copy()
+        return None
 
     def clean(self) -> None:
         """Clean up any leftovers form browser, like tmp files."""
@@ -23,6 +23,24 @@ class ChannelInterface(Protocol):
 
         """
 
+    def write_jsons(self, objs: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Accept several objects and send them down the channel in one write.
+
+        Args:
+            objs: the objects to send to the browser.
+
+        """
+
+    def read_frames(self, *, blocking: bool = True) -> Sequence[memoryview]:
+        """
+        Read all available messages in the channel as raw, unparsed bytes.
+
+        Args:
+            blocking: should this method block on read or return immediately.
+
+        """
+
     def read_jsons(self, *, blocking: bool = True) -> Sequence[BrowserResponse]:
         """
         Read all available jsons in the channel and returns a list of complete ones.
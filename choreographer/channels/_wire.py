@@ -8,6 +8,14 @@ from simplejson.errors import JSONDecodeError
 
 from ._errors import JSONError
 
+# orjson is optional: much faster, falls back to simplejson if missing or it can't
+try:
+    import orjson  # type: ignore [import-not-found, unused-ignore]
+
+    _with_orjson = True
+except ImportError:
+    _with_orjson = False
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -29,7 +37,27 @@ class MultiEncoder(simplejson.JSONEncoder):
         return simplejson.JSONEncoder.default(self, obj)
 
 
+_encoder = MultiEncoder()
+
+
 def serialize(obj: Any) -> bytes:
+    if _with_orjson:
+        try:
+            encoded = orjson.dumps(
+                obj,
+                default=_encoder.default,
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except orjson.JSONEncodeError:  # ints over 64 bits, non-str keys, etc
+            _logger.debug("orjson couldn't serialize, trying simplejson.")
+        else:
+            _logger.debug(
+                f"Serialized: {encoded[:15]!r}...{encoded[-15:]!r}, "
+                f"size: {len(encoded)}",
+            )
+            if _logger.isEnabledFor(logistro.DEBUG2):
+                _logger.debug2(f"Whole message: {encoded!r}")
+            return encoded
     try:
         message = simplejson.dumps(
             obj,
@@ -40,12 +68,24 @@ def serialize(obj: Any) -> bytes:
     except JSONDecodeError as e:
         raise JSONError from e
     _logger.debug(f"Serialized: {message[:15]}...{message[-15:]}, size: {len(message)}")
-    _logger.debug2(f"Whole message: {message}")
+    if _logger.isEnabledFor(logistro.DEBUG2):
+        _logger.debug2(f"Whole message: {message}")
 
     return message.encode("utf-8")
 
 
-def deserialize(message: str) -> Any:
+def deserialize(message: str | bytes | memoryview) -> Any:
+    if _with_orjson:
+        try:
+            # orjson reads the buffer in place, no copy into a str first.
+            # NOTE: it parses ints over 64 bits as floats, losing precision
+            # where simplejson wouldn't. Devtools numbers are JS doubles, so
+            # the browser never sends one, but other json read here could.
+            return orjson.loads(message)
+        except orjson.JSONDecodeError:
+            _logger.debug("orjson couldn't deserialize, trying simplejson.")
+    if isinstance(message, memoryview):
+        message = message.tobytes()
     try:
         return simplejson.loads(message)
     except simplejson.errors.JSONDecodeError as e:
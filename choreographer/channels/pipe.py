@@ -65,15 +65,28 @@ class Pipe:
         Args:
             obj: any python object that serializes to json.
 
+        """
+        self.write_jsons([obj])
+
+    def write_jsons(self, objs: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Send several jsons down the pipe with one write.
+
+        Args:
+            objs: any python objects that serialize to json.
+
         """
         if self.shutdown_lock.locked():
             raise ChannelClosedError
-        encoded_message = wire.serialize(obj) + b"\0"
+        # all serialized before writing: if one fails, nothing is written
+        encoded_message = b"".join(wire.serialize(obj) + b"\0" for obj in objs)
+        _logger.debug(f"Writing {len(objs)} message(s) in one write.")
         _logger.debug(
             f"Writing message {encoded_message[:15]!r}...{encoded_message[-15:]!r}, "
             f"size: {len(encoded_message)}.",
         )
-        _logger.debug2(f"Full Message: {encoded_message!r}")
+        if _logger.isEnabledFor(logistro.DEBUG2):  # repr of every write is costly
+            _logger.debug2(f"Full Message: {encoded_message!r}")
         try:
             ret = os.write(self._write_to_browser, encoded_message)
             _logger.debug(
@@ -87,19 +100,21 @@ class Pipe:
             self.close()
             raise ChannelClosedError from e
 
-    def read_jsons(  # noqa: PLR0912, PLR0915, C901 branches, complexity
+    def read_frames(  # noqa: PLR0912, C901 branches, complexity
         self,
         *,
         blocking: bool = True,
-    ) -> Sequence[BrowserResponse]:
+    ) -> Sequence[memoryview]:
         """
-        Read from the pipe and return one or more jsons in a list.
+        Read from the pipe and return the raw bytes of each message, unparsed.
+
+        The views all share one read buffer, so nothing is copied per message.
 
         Args:
             blocking: The read option can be set to block or not.
 
         Returns:
-            A list of jsons.
+            A list of memoryviews, one per message.
 
         """
         if self.shutdown_lock.locked():
@@ -109,17 +124,16 @@ class Pipe:
                 "Windows python version < 3.12 does not support non-blocking",
                 BlockWarning,
             )
-        jsons: list[BrowserResponse] = []
         try:
             if _with_block:
                 os.set_blocking(self._read_from_browser, blocking)
         except OSError as e:
             self.close()
             raise ChannelClosedError from e
+        raw_buffer = bytearray()  # if we fail in read, we already defined
         try:
             loop_count = 1
-            raw_buffer = None  # if we fail in read, we already defined
-            raw_buffer = os.read(
+            raw_buffer += os.read(
                 self._read_from_browser,
                 10000,
             )  # 10MB buffer, nbd, doesn't matter w/ this
@@ -127,7 +141,6 @@ class Pipe:
                 f"First read in loop: {raw_buffer[:15]!r}...{raw_buffer[-15:]!r}. "
                 f"size: {len(raw_buffer)}.",
             )
-            _logger.debug2(f"Whole buffer: {raw_buffer!r}")
             if not raw_buffer or raw_buffer == b"{bye}\n":
                 if raw_buffer:
                     _logger.debug(f"Received {raw_buffer!r}. is bye?")
@@ -142,7 +155,7 @@ class Pipe:
                 raw_buffer += os.read(self._read_from_browser, 10000)
         except BlockingIOError:
             _logger.debug("BlockingIOError")
-            return jsons
+            return []
         except OSError as e:
             _logger.debug("OSError")
             self.close()
@@ -151,22 +164,46 @@ class Pipe:
             # this could be hard to test as it is a real OS corner case
         finally:
             _logger.debug(
-                f"Total loops: {loop_count}, "
-                f"Final size: {len(raw_buffer) if raw_buffer else 0}.",
+                f"Total loops: {loop_count}, Final size: {len(raw_buffer)}.",
             )
-            _logger.debug2(f"Whole buffer: {raw_buffer!r}")
-        decoded_buffer = raw_buffer.decode("utf-8")
-        raw_messages = decoded_buffer.split("\0")
-        _logger.debug(f"Received {len(raw_messages)} raw_messages.")
-        for raw_message in raw_messages:
-            if raw_message:
-                try:
-                    jsons.append(wire.deserialize(raw_message))
-                except JSONError:
-                    _logger.exception("JSONError decoding message. Ignoring")
-                except:
-                    _logger.exception("Error in trying to decode JSON off our read.")
-                    raise
+            if _logger.isEnabledFor(logistro.DEBUG2):  # repr of every read is costly
+                _logger.debug2(f"Whole buffer: {raw_buffer!r}")
+        view = memoryview(raw_buffer)
+        frames = []
+        start = 0
+        while (end := raw_buffer.find(0, start)) != -1:
+            if end > start:
+                frames.append(view[start:end])
+            start = end + 1
+        if start < len(raw_buffer):  # only after an OSError mid-message
+            frames.append(view[start:])
+        _logger.debug(f"Received {len(frames)} raw_messages.")
+        return frames
+
+    def read_jsons(
+        self,
+        *,
+        blocking: bool = True,
+    ) -> Sequence[BrowserResponse]:
+        """
+        Read from the pipe and return one or more jsons in a list.
+
+        Args:
+            blocking: The read option can be set to block or not.
+
+        Returns:
+            A list of jsons.
+
+        """
+        jsons: list[BrowserResponse] = []
+        for frame in self.read_frames(blocking=blocking):
+            try:
+                jsons.append(wire.deserialize(frame))
+            except JSONError:  # noqa: PERF203 one bad message can't drop the rest
+                _logger.exception("JSONError decoding message. Ignoring")
+            except:
+                _logger.exception("Error in trying to decode JSON off our read.")
+                raise
         return jsons
 
     def _unblock_fd(self, fd: int) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import inspect
+import re
 from typing import TYPE_CHECKING
 
 import logistro
@@ -11,10 +11,24 @@ from choreographer import protocol
 
 if TYPE_CHECKING:
     import asyncio
-    from typing import Any, Callable, Coroutine, MutableMapping
+    from typing import (
+        Any,
+        Callable,
+        Coroutine,
+        Mapping,
+        MutableMapping,
+        Optional,
+        Sequence,
+    )
 
     from choreographer._brokers import Broker
 
+    EventCallback = Callable[
+        [protocol.BrowserResponse],
+        Optional[Coroutine[Any, Any, Any]],
+    ]
+    Subscription = tuple[EventCallback, bool]
+
 _logger = logistro.getLogger(__name__)
 
 
@@ -25,13 +39,12 @@ class Session:
     """The id of the session given by the browser."""
     message_id: int
     """All messages are counted per session and this is the current message id."""
-    subscriptions: MutableMapping[
-        str,
-        tuple[
-            Callable[[protocol.BrowserResponse], Coroutine[Any, Any, Any]],
-            bool,
-        ],
-    ]
+    _exact: MutableMapping[str, Subscription]
+    """Subscriptions to exactly one event, by event name."""
+    _wildcards: MutableMapping[str, Subscription]
+    """Subscriptions ending in `*`, by the prefix before the `*`."""
+    _wildcards_re: re.Pattern[str] | None
+    """All the wildcard prefixes as one regex, built when needed."""
 
     def __init__(self, session_id: str, broker: Broker) -> None:
         """
@@ -54,7 +67,20 @@ class Session:
         self.session_id = session_id
         _logger.debug(f"New session: {session_id}")
         self.message_id = 0
-        self.subscriptions = {}
+        # sessionId is the same for every command, so only build it once
+        self._command_base = {"sessionId": session_id} if session_id else {}
+        self._exact = {}
+        self._wildcards = {}
+        self._wildcards_re = None
+
+    @property
+    def subscriptions(self) -> Mapping[str, Subscription]:
+        """A read-only view of all the subscriptions, by subscription string."""
+        subscriptions = dict(self._exact)
+        subscriptions.update(
+            (f"{prefix}*", sub) for prefix, sub in self._wildcards.items()
+        )
+        return subscriptions
 
     async def send_command(
         self,
@@ -80,24 +106,23 @@ class Session:
             {
                 "id": current_id,
                 "method": command,
+                **self._command_base,
             },
         )
-
-        if self.session_id:
-            json_command["sessionId"] = self.session_id
         if params:
             json_command["params"] = params
         _logger.debug(
             f"Cmd '{command}', param keys '{params.keys() if params else ''}', "
             f"sessionId '{self.session_id}'",
         )
-        _logger.debug2(f"Full params: {str(params).replace('%', '%%')}")
+        if _logger.isEnabledFor(logistro.DEBUG2):  # params can be huge, skip str()
+            _logger.debug2(f"Full params: {str(params).replace('%', '%%')}")
         return await self._broker.write_json(json_command)
 
     def subscribe(
         self,
         string: str,
-        callback: Callable[[protocol.BrowserResponse], Coroutine[Any, Any, Any]],
+        callback: EventCallback,
         *,
         repeating: bool = True,
     ) -> None:
@@ -106,23 +131,26 @@ class Session:
 
         Args:
             string: the name of the event. Can use * wildcard at the end.
-            callback: the callback (which takes a message dict and returns nothing)
+            callback: the callback (which takes a message dict and returns nothing).
+                `async def` callbacks are run as tasks, plain functions are
+                called right away, so they should be quick.
             repeating: default True, should the callback execute more than once
 
         """
-        if not inspect.iscoroutinefunction(callback):
+        if not callable(callback):
             raise TypeError(
-                "Call back must be be `async def` type function.",
+                "Call back must be a function, `def` or `async def`.",
             )
         if string in self.subscriptions:
             raise ValueError(
                 "You are already subscribed to this string, "
                 "duplicate subscriptions are not allowed.",
             )
+        elif string.endswith("*"):
+            self._wildcards[string[:-1]] = (callback, repeating)
+            self._wildcards_re = None
         else:
-            # so this should be per session
-            # and that means we need a list of all sessions
-            self.subscriptions[string] = (callback, repeating)
+            self._exact[string] = (callback, repeating)
 
     def unsubscribe(self, string: str) -> None:
         """
@@ -132,9 +160,48 @@ class Session:
             string: the subscription to remove.
 
         """
-        if string not in self.subscriptions:
-            return
-        del self.subscriptions[string]
+        if string.endswith("*"):
+            _ = self._wildcards.pop(string[:-1], None)
+            self._wildcards_re = None
+        else:
+            _ = self._exact.pop(string, None)
+
+    def _get_callbacks(
+        self,
+        method: str,
+    ) -> Sequence[EventCallback]:
+        """
+        Find the callbacks subscribed to an event, dropping non-repeating ones.
+
+        Args:
+            method: the name of the event.
+
+        Returns:
+            The callbacks to run for the event.
+
+        """
+        callbacks = []
+        sub = self._exact.get(method)
+        if sub:
+            callbacks.append(sub[0])
+            if not sub[1]:
+                del self._exact[method]
+        if not self._wildcards:
+            return callbacks
+        # one regex call rules out most events before checking each prefix
+        if self._wildcards_re is None:
+            self._wildcards_re = re.compile(
+                "|".join(re.escape(prefix) for prefix in self._wildcards),
+            )
+        if not self._wildcards_re.match(method):
+            return callbacks
+        for prefix, (callback, repeating) in list(self._wildcards.items()):
+            if method.startswith(prefix):
+                callbacks.append(callback)
+                if not repeating:
+                    del self._wildcards[prefix]
+                    self._wildcards_re = None
+        return callbacks
 
     def subscribe_once(self, string: str) -> asyncio.Future[Any]:
         """
@@ -188,9 +255,7 @@ class Target:
         self.sessions[session.session_id] = session
 
     def _remove_session(self, session_id: str) -> None:
-        if isinstance(session_id, Session):
-            session_id = session_id.session_id
-        _ = self.sessions.pop(session_id, None)
+        _ = self.sessions.pop(getattr(session_id, "session_id", session_id), None)
 
     def get_session(self) -> Session:
         """Retrieve the first session of the target, if it exists."""
@@ -250,8 +315,7 @@ class Target:
             session_id: the session to close
 
         """
-        if isinstance(session_id, Session):
-            session_id = session_id.session_id
+        session_id = getattr(session_id, "session_id", session_id)
         response = await self._broker._browser.send_command(  # noqa: SLF001 we need browser
             command="Target.detachFromTarget",
             params={"sessionId": session_id},
@@ -271,7 +335,7 @@ class Target:
     def subscribe(
         self,
         string: str,
-        callback: Callable[[protocol.BrowserResponse], Coroutine[Any, Any, Any]],
+        callback: EventCallback,
         *,
         repeating: bool = True,
     ) -> None:
@@ -280,7 +344,9 @@ class Target:
 
         Args:
             string: the name of the event. Can use * wildcard at the end.
-            callback: the callback (which takes a message dict and returns nothing)
+            callback: the callback (which takes a message dict and returns nothing).
+                `async def` callbacks are run as tasks, plain functions are
+                called right away, so they should be quick.
             repeating: default True, should the callback execute more than once
 
         """
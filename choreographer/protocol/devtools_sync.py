@@ -46,6 +46,8 @@ class SessionSync:
         self.session_id = session_id
         _logger.debug(f"New session: {session_id}.")
         self.message_id = 0
+        # sessionId is the same for every command, so only build it once
+        self._command_base = {"sessionId": session_id} if session_id else {}
 
     def send_command(
         self,
@@ -71,11 +73,9 @@ class SessionSync:
             {
                 "id": current_id,
                 "method": command,
+                **self._command_base,
             },
         )
-
-        if self.session_id:
-            json_command["sessionId"] = self.session_id
         if params:
             json_command["params"] = params
         _logger.debug(
@@ -117,9 +117,7 @@ class TargetSync:
         self.sessions[session.session_id] = session
 
     def _remove_session(self, session_id: str) -> None:
-        if isinstance(session_id, SessionSync):
-            session_id = session_id.session_id
-        _ = self.sessions.pop(session_id, None)
+        _ = self.sessions.pop(getattr(session_id, "session_id", session_id), None)
 
     def get_session(self) -> SessionSync:
         """Retrieve the first session of the target, if it exists."""
@@ -13,7 +13,11 @@ _logger = logistro.getLogger()
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Any, Sequence
+    from typing import Any, MutableMapping, Sequence
+
+# searching PATH (and the registry) is slow and the answer rarely changes.
+# only hits are kept, so a browser installed later will still be found.
+_which_cache: MutableMapping[tuple[str, ...], str] = {}
 
 
 def _is_exe(path: str | Path) -> bool:
@@ -83,13 +87,21 @@ def browser_which(
     if platform.system() == "Windows":
         os.environ["NoDefaultCurrentDirectoryInExePath"] = "0"  # noqa: SIM112 var name set by windows
 
+    cache_key = tuple(executable_names)
+    cached = _which_cache.get(cache_key)
+    if cached and _is_exe(cached):
+        _logger.debug(f"Returning cached path {cached}")
+        return cached
+
     for exe in executable_names:
         if platform.system() == "Windows" and exe == "chrome":
             path = _which_from_windows_reg()
         if path and _is_exe(path):
+            _which_cache[cache_key] = path
             return path
         path = shutil.which(exe)
         if path and _is_exe(path):
+            _which_cache[cache_key] = path
             return path
 
     return None
@@ -108,4 +120,7 @@ def get_browser_path(*args: Any, **kwargs: Any) -> str | None:  # noqa: D417: do
         skip_local: (default False) don't look for a choreo download of anything.
 
     """
-    return os.environ.get("BROWSER_PATH", browser_which(*args, **kwargs))
+    # don't search at all if the user told us where it is
+    if "BROWSER_PATH" in os.environ:
+        return os.environ["BROWSER_PATH"]
+    return browser_which(*args, **kwargs)
@@ -1,3 +1,5 @@
+import asyncio
+
 import logistro
 import pytest
 
@@ -122,6 +124,38 @@ async def test_populate_targets(browser):
     await browser.send_command(command="Target.createTarget", params={"url": ""})
     await browser.populate_targets()
     assert len(browser.tabs) >= 1
+    for _ in range(3):
+        await browser.send_command(command="Target.createTarget", params={"url": ""})
+    await browser.populate_targets()
+    assert len(browser.tabs) >= 4  # noqa: PLR2004 four targets created
+    for tab in browser.tabs.values():
+        assert len(tab.sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_populate_targets_error(browser, monkeypatch):
+    _logger.info("testing...")
+    target_ids = []
+    for _ in range(3):
+        response = await browser.send_command(
+            command="Target.createTarget",
+            params={"url": ""},
+        )
+        target_ids.append(response["result"]["targetId"])
+    create_session = choreo.Tab.create_session
+
+    async def failing_create_session(tab):
+        if tab.target_id == target_ids[0]:
+            raise RuntimeError("session failed")
+        return await create_session(tab)
+
+    monkeypatch.setattr(choreo.Tab, "create_session", failing_create_session)
+    with pytest.raises(RuntimeError, match="session failed"):
+        await browser.populate_targets()
+    # tabs that did get a session are still added, not leaked
+    assert target_ids[0] not in browser.tabs
+    for target_id in target_ids[1:]:
+        assert target_id in browser.tabs
 
 
 @pytest.mark.asyncio
@@ -132,3 +166,37 @@ async def test_get_tab(browser):
     await browser.create_tab()
     await browser.create_tab("")
     assert browser.get_tab() == next(iter(browser.tabs.values()))
+
+
+@pytest.mark.asyncio
+async def test_browser_send_command_concurrent(browser, monkeypatch):
+    _logger.info("testing...")
+    writes = []
+    write_jsons = browser._channel.write_jsons  # noqa: SLF001
+
+    def recording_write_jsons(objs):
+        writes.append(len(objs))
+        write_jsons(objs)
+
+    monkeypatch.setattr(browser._channel, "write_jsons", recording_write_jsons)  # noqa: SLF001
+    # Commands sent together are batched into the same write
+    responses = await asyncio.gather(
+        *(browser.send_command(command="Target.getTargets") for _ in range(10)),
+    )
+    assert writes == [10]
+    assert len(responses) == 10  # noqa: PLR2004 count of commands above
+    for response in responses:
+        assert "result" in response and "targetInfos" in response["result"]  # noqa: PT018 I like this assertion
+
+
+@pytest.mark.asyncio
+async def test_browser_send_command_concurrent_bad_command(browser):
+    _logger.info("testing...")
+    # A command that can't be serialized only fails itself, not its batch
+    good, bad = await asyncio.gather(
+        browser.send_command(command="Target.getTargets"),
+        browser.send_command(command="Target.getTargets", params={"x": object()}),
+        return_exceptions=True,
+    )
+    assert "result" in good
+    assert isinstance(bad, TypeError)
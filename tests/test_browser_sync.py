@@ -0,0 +1,43 @@
+import io
+import time
+
+import logistro
+
+import choreographer as choreo
+
+_logger = logistro.getLogger(__name__)
+
+
+def test_sync_close(headless):
+    _logger.info("testing...")
+    browser = choreo.BrowserSync(headless=headless)
+    browser.open()
+    try:
+        assert not browser._is_closed()  # noqa: SLF001
+    finally:
+        browser.close()
+    assert browser._is_closed()  # noqa: SLF001
+    assert browser.subprocess.poll() is not None
+
+
+def _wait_for_output(output, text):
+    for _ in range(50):
+        if text in output.getvalue():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def test_sync_output_thread(request):
+    _logger.info("testing...")
+    output = io.StringIO()
+    browser = choreo.BrowserSync(headless=request.config.getoption("--headless"))
+    browser.open()
+    try:
+        # print() accepts end=None, so the output thread must too
+        browser.start_output_thread(end=None, file=output)
+        browser.send_command("Target.getTargets")
+        assert _wait_for_output(output, '"targetInfos"')
+    finally:
+        browser.close()
+    assert _wait_for_output(output, "ChannelClosedError caught.")
@@ -0,0 +1,26 @@
+import sys
+
+import logistro
+
+from choreographer.browsers import Chromium
+from choreographer.channels import Pipe
+
+_logger = logistro.getLogger(__name__)
+
+
+# no browser is launched, any executable will do as the path
+def test_tmp_dir_lazy():
+    _logger.info("testing...")
+    pipe = Pipe()
+    try:
+        chromium = Chromium(pipe, sys.executable)
+        assert not hasattr(chromium, "tmp_dir")
+        chromium.clean()  # nothing to clean yet, must not fail
+        chromium.get_cli()
+        assert chromium.tmp_dir.path.exists()
+        assert f"--user-data-dir={chromium.tmp_dir.path}" in chromium.get_cli()
+        chromium.clean()
+        assert not chromium.tmp_dir.exists
+        assert not chromium.tmp_dir.path.exists()
+    finally:
+        pipe.close()
@@ -18,15 +18,28 @@ pytestmark = pytest.mark.asyncio(loop_scope="function")
 _timestamp = datetime(1970, 1, 1, tzinfo=UTC)
 
 data = [1, 2.00, 3, float("nan"), float("inf"), float("-inf"), _timestamp]
-expected_message = b'[1, 2.0, 3, null, null, null, "1970-01-01T00:00:00+00:00"]'
+_expected_message = b'[1, 2.0, 3, null, null, null, "1970-01-01T00:00:00+00:00"]'
 converted_type = [int, float, int, type(None), type(None), type(None), str]
 
 _logger = logistro.getLogger(__name__)
 
 
+# orjson is optional, and its output is compact
+@pytest.fixture(params=[True, False], ids=["orjson", "simplejson"])
+def with_orjson(request, monkeypatch):
+    if request.param and not wire._with_orjson:  # noqa: SLF001
+        pytest.skip("orjson not installed.")
+    monkeypatch.setattr(wire, "_with_orjson", request.param)
+    return request.param
+
+
 @pytest.mark.asyncio
-async def test_de_serialize():
+async def test_de_serialize(with_orjson):
     _logger.info("testing...")
+    if with_orjson:
+        expected_message = _expected_message.replace(b", ", b",")
+    else:
+        expected_message = _expected_message
     message = wire.serialize(data)
     assert message == expected_message
     obj = wire.deserialize(message)
@@ -39,3 +52,18 @@ async def test_de_serialize():
     assert len(obj_np) == len(converted_type)
     for o, t in zip(obj_np, converted_type):
         assert isinstance(o, t)
+    # the pipe hands over views of its read buffer, not bytes
+    obj_view = wire.deserialize(memoryview(message))
+    assert obj_view == obj
+
+
+@pytest.mark.asyncio
+async def test_deserialize_big_int(with_orjson):
+    _logger.info("testing...")
+    big = 123456789012345678901234567890
+    obj = wire.deserialize(f'{{"a": {big}}}'.encode())
+    # orjson reads ints over 64 bits as floats, simplejson keeps them exact
+    if with_orjson:
+        assert obj["a"] == float(big)
+    else:
+        assert obj["a"] == big
@@ -38,3 +38,31 @@ async def test_session_send_command(session):
         choreo.protocol.MessageTypeError,
     ):
         await session.send_command(command=12345)
+
+
+@pytest.mark.asyncio
+async def test_session_subscriptions(session):
+    _logger.info("testing...")
+
+    async def callback(_r):
+        pass
+
+    session.subscribe("Page.loadEventFired", callback)
+    session.subscribe("Page.*", callback, repeating=False)
+    session.subscribe("*", callback)
+    assert set(session.subscriptions) == {"Page.loadEventFired", "Page.*", "*"}
+
+    callbacks = session._get_callbacks("Page.loadEventFired")  # noqa: SLF001
+    assert len(callbacks) == 3  # noqa: PLR2004 all three match
+    # non-repeating subscription is dropped after matching once
+    assert "Page.*" not in session.subscriptions
+    assert len(session._get_callbacks("Target.targetCreated")) == 1  # noqa: SLF001
+
+    session.unsubscribe("*")
+    session.subscribe("Network.*", callback)
+    assert not session._get_callbacks("Target.targetCreated")  # noqa: SLF001
+    assert len(session._get_callbacks("Network.requestWillBeSent")) == 1  # noqa: SLF001
+
+    session.unsubscribe("Network.*")
+    session.unsubscribe("Page.loadEventFired")
+    assert not session.subscriptions
@@ -91,3 +91,24 @@ async def test_subscribe_and_unsubscribe(browser):
     await tab.send_command("Page.enable")
     await tab.send_command("Page.reload")
     assert old_counter == counter
+
+
+@pytest.mark.asyncio
+async def test_subscribe_sync_callback(browser):
+    _logger.info("testing...")
+    tab = await browser.create_tab("")
+    counter = 0
+
+    def count_event(_r):
+        nonlocal counter
+        counter += 1
+
+    tab.subscribe("Page.*", count_event)
+    await tab.send_command("Page.enable")
+    await tab.send_command("Page.reload")
+    await asyncio.sleep(0.5)
+    assert counter > 0
+    tab.unsubscribe("Page.*")
+
+    with pytest.raises(TypeError):
+        tab.subscribe("Page.*", "not a function")